@@ -1,17 +1,29 @@
 import os
+import io
+import functools
+import hashlib
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import subprocess
 import shutil
+import tempfile
 from PIL import Image, ImageDraw
 import math
 
+# OpenCV is used for its faster area/Lanczos resize, fall back to PIL without it
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+
 def create_multisize_cursor_config(cursors_dir, cursor_name, image_file, sizes=[16, 24, 32, 48, 64]):
     """
     Create cursor configuration with multiple sizes for better scaling
     """
     config_file = cursors_dir / f"{cursor_name}.cursor"
     
-    config_content = f"# {cursor_name} cursor - Multi-size version\n"
+    lines = [f"# {cursor_name} cursor - Multi-size version"]
     
     for size in sizes:
         # Calculate hotspot (center for most cursors)
@@ -35,13 +47,145 @@ def create_multisize_cursor_config(cursors_dir, cursor_name, image_file, sizes=[
             hotspot_x = size // 2
             hotspot_y = size // 2
         
-        config_content += f"{size} {hotspot_x} {hotspot_y} {image_file} 100\n"
+        lines.append(f"{size} {hotspot_x} {hotspot_y} {image_file} 100")
     
-    with open(config_file, 'w') as f:
-        f.write(config_content)
+    config_file.write_text("\n".join(lines) + "\n")
     
     print(f"  📐 {cursor_name} - sizes: {sizes}")
 
+# Sizes at or below this are resampled straight from the source image with PIL;
+# OpenCV takes them from the nearest pyramid rung to avoid one large shrink
+PYRAMID_MIN_SIZE = 24
+
+# zlib level for the intermediate PNGs
+PNG_COMPRESS_LEVEL = 1
+
+# Sizes at or below this are written as palette PNGs when they fit in 256 colours
+PALETTE_MAX_SIZE = 32
+
+# Scaled images already written by this process, keyed by (source path, chain)
+_written_images = {}
+
+@functools.lru_cache(maxsize=1)
+def _load_rgba(path_str):
+    """
+    Load the source image as RGBA (premultiplied BGRA with OpenCV), reused while all sizes of a cursor are scaled
+    """
+    if cv2 is not None:
+        # IMREAD_UNCHANGED keeps the alpha channel
+        img = cv2.imread(path_str, cv2.IMREAD_UNCHANGED)
+        if img is None:
+            raise ValueError(f"cannot read image {path_str}")
+        if img.dtype != np.uint8:
+            img = (img // 257).astype(np.uint8)
+        if img.ndim == 2:
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGRA)
+        elif img.shape[2] == 3:
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+        # Resample with premultiplied alpha like PIL does, so transparent
+        # pixels don't bleed their colour into the edges
+        return cv2.cvtColor(img, cv2.COLOR_RGBA2mRGBA)
+    
+    with Image.open(path_str) as img:
+        if img.mode == 'RGBA':
+            # Decode before the file is closed, no converted copy is needed
+            img.load()
+            return img
+        
+        # Convert to RGBA and release the decoded original straight away
+        rgba_img = img.convert('RGBA')
+        img.close()
+        return rgba_img
+
+def _resize(img, size):
+    """
+    Resample an image to size x size, with a Lanczos filter where it does not alias
+    """
+    if cv2 is not None:
+        # INTER_LANCZOS4 has a fixed 8x8 kernel that does not widen when shrinking
+        # and aliases even on small steps, so downscale with area averaging
+        downscale = max(img.shape[:2]) > size
+        interpolation = cv2.INTER_AREA if downscale else cv2.INTER_LANCZOS4
+        return cv2.resize(img, (size, size), interpolation=interpolation)
+    
+    # Use high-quality resampling
+    return img.resize((size, size), Image.Resampling.LANCZOS)
+
+@functools.lru_cache(maxsize=16)
+def _resampled(path_str, chain):
+    """
+    Resample along chain (descending sizes), each step from the previous, larger rung
+    """
+    parent = _resampled(path_str, chain[:-1]) if len(chain) > 1 else _load_rgba(path_str)
+    return _resize(parent, chain[-1])
+
+def _encode_palette_png(rgba_img):
+    """
+    Encode an RGBA image as an exact palette PNG with tRNS alpha, None if that would be lossy
+    """
+    colors = rgba_img.getcolors(256)
+    if colors is None:
+        return None
+    
+    palette = [bytes(color) for _, color in colors]
+    index = {color: i for i, color in enumerate(palette)}
+    pixels = rgba_img.tobytes()
+    palette_img = Image.frombytes('P', rgba_img.size,
+                                  bytes(index[pixels[i:i + 4]] for i in range(0, len(pixels), 4)))
+    palette_img.putpalette(b"".join(color[:3] for color in palette))
+    
+    buffer = io.BytesIO()
+    palette_img.save(buffer, 'PNG', transparency=bytes(color[3] for color in palette),
+                     compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+    
+    # Only use it if it decodes back to exactly the pixels we started with
+    with Image.open(io.BytesIO(buffer.getvalue())) as decoded:
+        if decoded.convert('RGBA').tobytes() != pixels:
+            return None
+    return buffer.getvalue()
+
+@functools.lru_cache(maxsize=None)
+def _resample_to(path_str, chain):
+    """
+    Resample an image along chain once and return the encoded PNG bytes
+    """
+    resized_img = _resampled(path_str, chain)
+    if cv2 is not None:
+        resized_img = cv2.cvtColor(resized_img, cv2.COLOR_mRGBA2RGBA)
+    
+    # Small sizes are written as 8-bit palette PNGs with alpha when that is
+    # lossless; xcursorgen expands them on load. The palette is built with PIL
+    if chain[-1] <= PALETTE_MAX_SIZE:
+        rgba_img = resized_img
+        if cv2 is not None:
+            rgba_img = Image.fromarray(cv2.cvtColor(resized_img, cv2.COLOR_BGRA2RGBA))
+        encoded = _encode_palette_png(rgba_img)
+        if encoded is not None:
+            return encoded
+    
+    if cv2 is not None:
+        ok, buffer = cv2.imencode('.png', resized_img, [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESS_LEVEL])
+        if not ok:
+            raise ValueError(f"cannot encode {chain[-1]}x{chain[-1]} image for {path_str}")
+        return buffer.tobytes()
+    
+    # These PNGs are throwaway xcursorgen inputs, so favour encoding speed over size
+    buffer = io.BytesIO()
+    resized_img.save(buffer, 'PNG', compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+    return buffer.getvalue()
+
+def _link_image(previous, scaled_path):
+    """
+    Hard link scaled_path to an already written image, False if that is not possible
+    """
+    if previous is None or not hasattr(os, 'link'):
+        return False
+    try:
+        os.link(previous, scaled_path)
+    except OSError:
+        return False
+    return True
+
 def create_scaled_images(original_image, cursor_name, output_dir, sizes=[16, 24, 32, 48, 64, 96, 128]):
     """
     Create scaled versions of the original image for different cursor sizes
@@ -49,26 +193,30 @@ def create_scaled_images(original_image, cursor_name, output_dir, sizes=[16, 24,
     scaled_images = {}
     
     try:
-        with Image.open(original_image) as img:
-            # Convert to RGBA if necessary
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
+        source = str(Path(original_image).resolve())
+        pyramid = ()
+        
+        # Scale largest first so each size is resampled from the previous one
+        for size in sorted(sizes, reverse=True):
+            if size > PYRAMID_MIN_SIZE or cv2 is not None:
+                pyramid += (size,)
+                chain = pyramid
+            else:
+                # PIL's Lanczos widens with the shrink factor, so small sizes keep
+                # more detail taken straight from the source than through the pyramid
+                chain = (size,)
             
-            original_size = max(img.width, img.height)
+            scaled_filename = f"{cursor_name}_{size}x{size}.png"
+            scaled_path = output_dir / scaled_filename
+            # Never write through an existing hard link
+            scaled_path.unlink(missing_ok=True)
             
-            for size in sizes:
-                # Calculate scale factor
-                scale = size / original_size
-                
-                # Use high-quality resampling
-                resized_img = img.resize((size, size), Image.Resampling.LANCZOS)
-                
-                # Save scaled image
-                scaled_filename = f"{cursor_name}_{size}x{size}.png"
-                scaled_path = output_dir / scaled_filename
-                resized_img.save(scaled_path, 'PNG')
-                
-                scaled_images[size] = scaled_filename
+            # Link to an identical image written for another cursor if possible
+            if not _link_image(_written_images.get((source, chain)), scaled_path):
+                scaled_path.write_bytes(_resample_to(source, chain))
+                _written_images[(source, chain)] = scaled_path
+            
+            scaled_images[size] = scaled_filename
                 
     except Exception as e:
         print(f"  ⚠️  Could not scale {original_image}: {e}")
@@ -81,95 +229,116 @@ def create_scaled_images(original_image, cursor_name, output_dir, sizes=[16, 24,
 def create_optimized_multisize_config(cursors_dir, cursor_name, original_image, sizes=[16, 24, 32, 48, 64, 96, 128]):
     """
     Create optimized multi-size configuration with properly scaled images
+
+    Only the scaled images are written here; the config text is returned as
+    (cursor_name, config_content, scaled_images) so it can run in a worker process
     """
-    config_file = cursors_dir / f"{cursor_name}.cursor"
-    
     # Create scaled images
     scaled_images = create_scaled_images(original_image, cursor_name, cursors_dir, sizes)
     
-    config_content = f"# {cursor_name} cursor - Optimized multi-size\n"
+    # Dynamic hotspot based on cursor type, resolved once and evaluated per size
+    hotspot_policy = _HOTSPOT_FN[_CATEGORY.get(cursor_name, 'center')]
+    hotspots = [hotspot_policy(size) for size in sizes]
+    image_for = scaled_images.get
+    image_files = [image_for(size, original_image.name) for size in sizes]
     
-    for size in sizes:
-        image_file = scaled_images.get(size, original_image.name)
-        
-        # Calculate dynamic hotspot based on cursor type and size
-        hotspot_x, hotspot_y = calculate_hotspot(cursor_name, size)
-        
-        config_content += f"{size} {hotspot_x} {hotspot_y} {image_file} 100\n"
+    config_content = "\n".join([
+        f"# {cursor_name} cursor - Optimized multi-size",
+        *(f"{size} {hotspot_x} {hotspot_y} {image_file} 100"
+          for size, (hotspot_x, hotspot_y), image_file in zip(sizes, hotspots, image_files)),
+    ]) + "\n"
     
-    with open(config_file, 'w') as f:
-        f.write(config_content)
+    return cursor_name, config_content, scaled_images
+
+def create_optimized_multisize_configs(cursors_dir, cursor_names, original_image, sizes):
+    """
+    Run create_optimized_multisize_config for several cursors sharing one source image
+    """
+    return [create_optimized_multisize_config(cursors_dir, cursor_name, original_image, sizes)
+            for cursor_name in cursor_names]
+
+def write_cursor_config(cursors_dir, cursor_name, config_content, sizes):
+    """
+    Write a cursor configuration produced by create_optimized_multisize_config
+    """
+    config_file = cursors_dir / f"{cursor_name}.cursor"
+    # Never write through a duplicate symlink left by a previous run
+    config_file.unlink(missing_ok=True)
+    
+    config_file.write_text(config_content)
     
     print(f"  🎯 {cursor_name} - optimized sizes: {sizes}")
 
+def link_duplicate_config(cursors_dir, cursor_name, source_cursor):
+    """
+    Symlink the config of a cursor whose output would be identical to source_cursor
+    """
+    config_file = cursors_dir / f"{cursor_name}.cursor"
+    config_file.unlink(missing_ok=True)
+    config_file.symlink_to(f"{source_cursor}.cursor")
+    
+    print(f"  🔗 {cursor_name} - same as {source_cursor}")
+
+@functools.lru_cache(maxsize=None)
+def _content_digest(path_str):
+    """SHA-1 of an image file's content"""
+    return hashlib.sha1(Path(path_str).read_bytes()).hexdigest()
+
+def _center_hotspot(size):
+    """Default center hotspot"""
+    return size // 2, size // 2
+
+# Hotspot function per cursor category
+_HOTSPOT_FN = {
+    'center': _center_hotspot,
+    # Tip at top-left
+    'arrow': lambda size: (max(1, size // 16), max(1, size // 16)),
+    # Finger tip, about 1/5 from left and very top
+    'hand': lambda size: (max(1, size * 6 // 32), max(1, size // 16)),
+    # Corner resize - towards their corner
+    'top_left': lambda size: (max(1, size // 8), max(1, size // 8)),
+    'top_right': lambda size: (size - max(1, size // 8), max(1, size // 8)),
+    'bottom_left': lambda size: (max(1, size // 8), size - max(1, size // 8)),
+    'bottom_right': lambda size: (size - max(1, size // 8), size - max(1, size // 8)),
+}
+
+# Cursor category per cursor name, anything missing uses 'center'
+_CATEGORY = {}
+
+# Arrow pointers
+_CATEGORY.update(dict.fromkeys(['left_ptr', 'arrow', 'default', 'right_ptr', 'top_left_arrow'], 'arrow'))
+
+# Hand cursors
+_CATEGORY.update(dict.fromkeys(['hand2', 'hand', 'pointer', 'pointing_hand'], 'hand'))
+
+# Text, cross, move, edge resize, wait and forbidden cursors
+_CATEGORY.update(dict.fromkeys(['xterm', 'text', 'ibeam',
+                                'crosshair', 'cross', 'tcross', 'diamond_cross',
+                                'fleur', 'size_all', 'move',
+                                'sb_h_double_arrow', 'size_hor', 'h-double-arrow', 'col-resize',
+                                'sb_v_double_arrow', 'size_ver', 'v_double_arrow', 'row-resize',
+                                'watch', 'wait', 'progress',
+                                'forbidden', 'not_allowed', 'crossed_circle'], 'center'))
+
+# Corner resize cursors
+_CATEGORY.update(dict.fromkeys(['top_left_corner', 'nw-resize', 'size_fdiag'], 'top_left'))
+_CATEGORY.update(dict.fromkeys(['top_right_corner', 'ne-resize', 'size_bdiag'], 'top_right'))
+_CATEGORY.update(dict.fromkeys(['bottom_left_corner', 'sw-resize'], 'bottom_left'))
+_CATEGORY.update(dict.fromkeys(['bottom_right_corner', 'se-resize'], 'bottom_right'))
+
 def calculate_hotspot(cursor_name, size):
     """
     Calculate appropriate hotspot for different cursor types and sizes
     """
-    # Default center hotspot
-    hotspot_x = size // 2
-    hotspot_y = size // 2
-    
-    # Arrow pointers - tip at top-left
-    if cursor_name in ['left_ptr', 'arrow', 'default', 'right_ptr', 'top_left_arrow']:
-        hotspot_x = max(1, size // 16)  # Very left for tip
-        hotspot_y = max(1, size // 16)  # Very top for tip
-    
-    # Hand cursors - at finger tip
-    elif cursor_name in ['hand2', 'hand', 'pointer', 'pointing_hand']:
-        hotspot_x = max(1, size * 6 // 32)  # About 1/5 from left
-        hotspot_y = max(1, size // 16)      # Very top
-    
-    # Text cursors - centered but slightly left
-    elif cursor_name in ['xterm', 'text', 'ibeam']:
-        hotspot_x = size // 2
-        hotspot_y = size // 2
-    
-    # Cross cursors - exact center
-    elif cursor_name in ['crosshair', 'cross', 'tcross', 'diamond_cross']:
-        hotspot_x = size // 2
-        hotspot_y = size // 2
-    
-    # Move cursor - center
-    elif cursor_name in ['fleur', 'size_all', 'move']:
-        hotspot_x = size // 2
-        hotspot_y = size // 2
-    
-    # Resize cursors - various edge positions
-    elif cursor_name in ['sb_h_double_arrow', 'size_hor', 'h-double-arrow', 'col-resize']:
-        hotspot_x = size // 2
-        hotspot_y = size // 2
-    elif cursor_name in ['sb_v_double_arrow', 'size_ver', 'v_double_arrow', 'row-resize']:
-        hotspot_x = size // 2
-        hotspot_y = size // 2
-    elif cursor_name in ['top_left_corner', 'nw-resize', 'size_fdiag']:
-        hotspot_x = max(1, size // 8)
-        hotspot_y = max(1, size // 8)
-    elif cursor_name in ['top_right_corner', 'ne-resize', 'size_bdiag']:
-        hotspot_x = size - max(1, size // 8)
-        hotspot_y = max(1, size // 8)
-    elif cursor_name in ['bottom_left_corner', 'sw-resize']:
-        hotspot_x = max(1, size // 8)
-        hotspot_y = size - max(1, size // 8)
-    elif cursor_name in ['bottom_right_corner', 'se-resize']:
-        hotspot_x = size - max(1, size // 8)
-        hotspot_y = size - max(1, size // 8)
-    
-    # Wait cursors - center
-    elif cursor_name in ['watch', 'wait', 'progress']:
-        hotspot_x = size // 2
-        hotspot_y = size // 2
-    
-    # Forbidden cursors - center
-    elif cursor_name in ['forbidden', 'not_allowed', 'crossed_circle']:
-        hotspot_x = size // 2
-        hotspot_y = size // 2
-    
-    return hotspot_x, hotspot_y
+    return _HOTSPOT_FN[_CATEGORY.get(cursor_name, 'center')](size)
 
-def create_fullsize_cursor_theme(image_folder=".", theme_name="fullsize_cursors"):
+def create_fullsize_cursor_theme(image_folder=".", theme_name="fullsize_cursors", build_dir=None, on_config=None):
     """
     Create full-size cursor theme with multiple sizes
+
+    Scaled images and configs go to build_dir if given (see create_build_dir),
+    otherwise to the theme's cursors directory. on_config is called with each
+    cursor name as soon as its config is written (see start_fullsize_generation)
     """
     
     # Standard cursor sizes for X11
@@ -201,22 +370,59 @@ def create_fullsize_cursor_theme(image_folder=".", theme_name="fullsize_cursors"
     theme_dir = Path(theme_name)
     cursors_dir = theme_dir / "cursors"
     cursors_dir.mkdir(parents=True, exist_ok=True)
+    if build_dir:
+        cursors_dir = Path(build_dir)
     
     print(f"🎨 Creating FULL-SIZE cursor theme: {theme_name}")
     print(f"📐 Supported sizes: {standard_sizes}")
     
-    # Get available images
-    image_files = list(Path(image_folder).glob("*.png"))
-    available_images = {img.name: img for img in image_files}
-    
-    # Create cursor configurations with multiple sizes
-    for image_name, cursor_name in image_to_cursor_map.items():
-        if image_name in available_images:
-            original_image = available_images[image_name]
-            create_optimized_multisize_config(cursors_dir, cursor_name, original_image, standard_sizes)
-    
-    # Create essential cursors with fallbacks
-    create_fullsize_essential_cursors(cursors_dir, image_to_cursor_map, available_images, standard_sizes)
+    # Get available images in a single directory scan
+    with os.scandir(image_folder) as entries:
+        available_images = {entry.name: Path(entry.path) for entry in entries
+                            if entry.name.endswith('.png') and entry.is_file()}
+    
+    # Collect (cursor_name, image) jobs for the mapped and essential cursors
+    jobs = [(cursor_name, available_images[image_name])
+            for image_name, cursor_name in image_to_cursor_map.items()
+            if image_name in available_images]
+    planned = {cursor_name for cursor_name, _ in jobs}
+    jobs += create_fullsize_essential_cursors(cursors_dir, image_to_cursor_map, available_images, planned)
+    
+    # Cursors with the same source content, hotspot policy and sizes would come out
+    # identical, so only the first of each group is scaled and generated
+    representatives = {}
+    duplicates = []
+    unique_jobs = []
+    for cursor_name, image_file in jobs:
+        key = (_content_digest(str(image_file)),
+               _CATEGORY.get(cursor_name, 'center'),
+               tuple(standard_sizes))
+        if key in representatives:
+            duplicates.append((cursor_name, representatives[key]))
+        else:
+            representatives[key] = cursor_name
+            unique_jobs.append((cursor_name, image_file))
+    jobs = unique_jobs
+    
+    # Group cursors by source image so each worker task reuses its resample cache
+    groups = {}
+    for cursor_name, image_file in jobs:
+        groups.setdefault(image_file, []).append(cursor_name)
+    
+    # Scale images in parallel and write each group's configs on the main process as
+    # soon as it finishes, so on_config can start xcursorgen while others still scale
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(create_optimized_multisize_configs,
+                                   cursors_dir, group_names, image_file, standard_sizes)
+                   for image_file, group_names in groups.items()]
+        for future in as_completed(futures):
+            for cursor_name, config_content, _ in future.result():
+                write_cursor_config(cursors_dir, cursor_name, config_content, standard_sizes)
+                if on_config:
+                    on_config(cursor_name)
+    
+    for cursor_name, source_cursor in duplicates:
+        link_duplicate_config(cursors_dir, cursor_name, source_cursor)
     
     # Create aliases
     create_fullsize_aliases(cursors_dir)
@@ -227,8 +433,8 @@ def create_fullsize_cursor_theme(image_folder=".", theme_name="fullsize_cursors"
     print(f"\n✅ Full-size theme structure created in: {theme_dir}")
     return theme_dir
 
-def create_fullsize_essential_cursors(cursors_dir, cursor_map, available_images, sizes):
-    """Create essential cursors with full-size support"""
+def create_fullsize_essential_cursors(cursors_dir, cursor_map, available_images, planned=()):
+    """Collect (cursor_name, image) jobs for essential cursors with full-size support"""
     
     essential_cursors = {
         'default': 'left_ptr',
@@ -267,8 +473,9 @@ def create_fullsize_essential_cursors(cursors_dir, cursor_map, available_images,
         'crossed_circle': 'forbidden'
     }
     
+    jobs = []
     for cursor_name, fallback in essential_cursors.items():
-        if cursor_name not in cursor_map:
+        if cursor_name not in cursor_map and cursor_name not in planned:
             config_file = cursors_dir / f"{cursor_name}.cursor"
             if not config_file.exists():
                 # Find appropriate image
@@ -279,7 +486,9 @@ def create_fullsize_essential_cursors(cursors_dir, cursor_map, available_images,
                     image_file = list(available_images.values())[0]
                 
                 if image_file:
-                    create_optimized_multisize_config(cursors_dir, cursor_name, image_file, sizes)
+                    jobs.append((cursor_name, image_file))
+    
+    return jobs
 
 def create_fullsize_aliases(cursors_dir):
     """Create aliases for full-size theme"""
@@ -301,23 +510,22 @@ def create_fullsize_aliases(cursors_dir):
         ['forbidden', 'not_allowed', 'no_drop', 'dnd-none', 'crossed_circle']
     ]
     
+    # Scan once for the configs already present, instead of a stat per candidate
+    with os.scandir(cursors_dir) as entries:
+        present = {entry.name[:-len('.cursor')] for entry in entries if entry.name.endswith('.cursor')}
+    
     for group in alias_groups:
-        source_cursor = None
-        for cursor in group:
-            config_file = cursors_dir / f"{cursor}.cursor"
-            if config_file.exists():
-                source_cursor = cursor
-                break
+        source_cursor = next((cursor for cursor in group if cursor in present), None)
         
         if source_cursor:
             for alias in group:
-                if alias != source_cursor:
+                if alias not in present:
                     alias_file = cursors_dir / f"{alias}.cursor"
-                    if not alias_file.exists():
-                        try:
-                            alias_file.symlink_to(f"{source_cursor}.cursor")
-                        except OSError:
-                            shutil.copy2(cursors_dir / f"{source_cursor}.cursor", alias_file)
+                    try:
+                        os.symlink(f"{source_cursor}.cursor", alias_file)
+                    except OSError:
+                        shutil.copy2(cursors_dir / f"{source_cursor}.cursor", alias_file)
+                    present.add(alias)
 
 def create_fullsize_theme_index(theme_dir, theme_name, sizes):
     """Create comprehensive theme index with size information"""
@@ -345,15 +553,102 @@ Comment=Full-size cursor theme
 X-KDE-FallbackTheme=core
 """
 
-    with open(theme_dir / "index.theme", 'w') as f:
-        f.write(theme_content)
+    (theme_dir / "index.theme").write_text(theme_content)
+
+def create_build_dir():
+    """
+    Create a tmpfs staging directory for scaled images and configs, None without /dev/shm
+    """
+    if not Path("/dev/shm").is_dir():
+        return None
+    return Path(tempfile.mkdtemp(prefix="gencursor-", dir="/dev/shm"))
+
+def run_xcursorgen(cursors_dir, cursor_name, output_file=None):
+    """Run xcursorgen for one cursor config inside cursors_dir"""
+    # Never write through an alias symlink left by a previous run
+    Path(cursors_dir, output_file or cursor_name).unlink(missing_ok=True)
+    return subprocess.run([
+        'xcursorgen',
+        f"{cursor_name}.cursor",
+        str(output_file or cursor_name)
+    ], cwd=cursors_dir, capture_output=True, text=True, timeout=30)
+
+def link_generated_aliases(build_dir, cursors_dir):
+    """Point generated alias and duplicate cursors at their source, mirroring the symlinked configs"""
+    linked = 0
+    with os.scandir(build_dir) as entries:
+        alias_configs = [entry for entry in entries if entry.name.endswith('.cursor') and entry.is_symlink()]
+    
+    for config_entry in alias_configs:
+        # Follow alias chains through duplicate configs to the generated cursor
+        source_cursor = Path(config_entry.path).resolve().stem
+        alias_file = cursors_dir / Path(config_entry.name).stem
+        if not (cursors_dir / source_cursor).exists():
+            continue
+        
+        # Replace stale links and cursors a previous run generated under this name
+        if os.path.lexists(alias_file):
+            if alias_file.is_symlink() and os.readlink(alias_file) == source_cursor:
+                continue
+            alias_file.unlink()
+        alias_file.symlink_to(source_cursor)
+        linked += 1
+    return linked
+
+def restore_build_files(build_dir, cursors_dir):
+    """Move staged configs and scaled images into the theme's cursors directory"""
+    with os.scandir(build_dir) as entries:
+        staged = [Path(entry.path) for entry in entries]
+    
+    for staged_file in staged:
+        target = cursors_dir / staged_file.name
+        if os.path.lexists(target):
+            target.unlink()
+        shutil.move(staged_file, target)
+    
+    build_dir.rmdir()
+
+def _output_size(output_file):
+    """Size of a generated cursor file in bytes, None if it was not written"""
+    try:
+        return output_file.stat().st_size
+    except OSError:
+        return None
 
-def generate_fullsize_cursors(theme_dir):
-    """Generate all cursor files with verbose output"""
+def start_fullsize_generation(theme_dir, build_dir=None):
+    """
+    Start generating cursors while the theme is still being built
+
+    Returns (on_config, pending): on_config hands each config to xcursorgen as
+    soon as create_fullsize_cursor_theme writes it, while other source images are
+    still being scaled; pending is passed on to generate_fullsize_cursors
+    """
     cursors_dir = Path(theme_dir) / "cursors"
+    build_dir = Path(build_dir) if build_dir else cursors_dir
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    futures = {}
     
-    if not cursors_dir.exists():
-        print(f"❌ Cursors directory not found: {cursors_dir}")
+    def on_config(cursor_name):
+        future = executor.submit(run_xcursorgen, build_dir, cursor_name, cursors_dir.resolve() / cursor_name)
+        futures[future] = cursor_name
+    
+    return on_config, (executor, futures)
+
+def generate_fullsize_cursors(theme_dir, build_dir=None, pending=None):
+    """
+    Generate all cursor files with verbose output
+
+    Configs are read from build_dir (kept in the theme if generation fails);
+    runs already started by start_fullsize_generation are collected from pending
+    """
+    cursors_dir = Path(theme_dir) / "cursors"
+    build_dir = Path(build_dir) if build_dir else cursors_dir
+    
+    if not build_dir.exists():
+        print(f"❌ Cursors directory not found: {build_dir}")
+        # Stop any runs start_fullsize_generation already queued
+        if pending:
+            pending[0].shutdown(cancel_futures=True)
         return
     
     print(f"\n🔨 Generating FULL-SIZE cursor files...")
@@ -361,35 +656,40 @@ def generate_fullsize_cursors(theme_dir):
     
     successful = 0
     failed = 0
-    
-    # Get all cursor config files (excluding symlinks)
-    config_files = [f for f in sorted(cursors_dir.glob("*.cursor")) if not f.is_symlink()]
-    
-    for i, config_file in enumerate(config_files, 1):
-        cursor_name = config_file.stem
+    total_size = 0
+    
+    # Get all cursor config names (excluding symlinks) in a single directory scan
+    with os.scandir(build_dir) as entries:
+        cursor_names = sorted(entry.name[:-len('.cursor')] for entry in entries
+                              if entry.name.endswith('.cursor') and not entry.is_symlink())
+    
+    # xcursorgen runs are independent, so run them concurrently; output goes
+    # straight to the theme so nothing has to be moved out of the build dir
+    executor, futures = pending or (ThreadPoolExecutor(max_workers=os.cpu_count()), {})
+    started = set(futures.values())
+    for cursor_name in cursor_names:
+        if cursor_name not in started:
+            futures[executor.submit(run_xcursorgen, build_dir, cursor_name,
+                                    cursors_dir.resolve() / cursor_name)] = cursor_name
+    
+    for i, future in enumerate(as_completed(futures), 1):
+        cursor_name = futures[future]
         output_file = cursors_dir / cursor_name
         
         # Progress indicator
-        progress = f"[{i}/{len(config_files)}]"
+        progress = f"[{i}/{len(futures)}]"
         
         try:
-            original_cwd = os.getcwd()
-            os.chdir(cursors_dir)
+            result = future.result()
             
-            result = subprocess.run([
-                'xcursorgen',
-                config_file.name,
-                cursor_name
-            ], capture_output=True, text=True, timeout=30)
+            # Get file size for information, a single stat also confirms the output exists
+            file_size = _output_size(output_file) if result.returncode == 0 else None
             
-            os.chdir(original_cwd)
-            
-            if result.returncode == 0 and output_file.exists():
-                # Get file size for information
-                file_size = output_file.stat().st_size
+            if file_size is not None:
                 size_kb = file_size / 1024
                 print(f"  {progress} ✅ {cursor_name:20} ({size_kb:5.1f} KB)")
                 successful += 1
+                total_size += file_size
             else:
                 print(f"  {progress} ❌ {cursor_name:20} - {result.stderr.strip()}")
                 failed += 1
@@ -403,17 +703,28 @@ def generate_fullsize_cursors(theme_dir):
         except subprocess.TimeoutExpired:
             print(f"  {progress} ⏰ {cursor_name:20} (timeout)")
             failed += 1
-            os.chdir(original_cwd)
         except Exception as e:
             print(f"  {progress} 💥 {cursor_name:20} - {e}")
             failed += 1
-            os.chdir(original_cwd)
+    
+    executor.shutdown(cancel_futures=True)
+    
+    if successful > 0:
+        linked = link_generated_aliases(build_dir, cursors_dir)
+        print(f"🔗 Linked {linked} alias cursors")
+    
+    if build_dir != cursors_dir:
+        if successful > 0 and failed == 0:
+            shutil.rmtree(build_dir, ignore_errors=True)
+        else:
+            # Keep configs and scaled images in the theme so generation can be re-run
+            restore_build_files(build_dir, cursors_dir)
+            print(f"📁 Cursor configs kept in: {cursors_dir}")
     
     print(f"\n📊 Generation complete: {successful}✅ {failed}❌")
     
     # Show total theme size
     if successful > 0:
-        total_size = sum(f.stat().st_size for f in cursors_dir.glob("*") if f.is_file() and not f.suffix == '.cursor')
         total_size_mb = total_size / (1024 * 1024)
         print(f"💾 Total theme size: {total_size_mb:.1f} MB")
 
@@ -481,8 +792,7 @@ echo "To manually set: export XCURSOR_THEME={theme_dir}"
 """
 
     script_file = theme_dir / "configure_hidpi.sh"
-    with open(script_file, 'w') as f:
-        f.write(script_content)
+    script_file.write_text(script_content)
     
     script_file.chmod(0o755)
     print(f"📜 High-DPI script created: {script_file}")
@@ -492,16 +802,32 @@ if __name__ == "__main__":
     print("🎯 FULL-SIZE X11 Cursor Theme Generator")
     print("=" * 60)
     
-    # Create full-size theme
-    theme_dir = create_fullsize_cursor_theme(
-        image_folder=".",
-        theme_name="fullsize_pro_cursors"
-    )
-    
-    # Generate cursor files
+    # Ask up front: generated themes stage their scaled images on tmpfs
     response = input("\n🚀 Generate full-size cursor files? This may take a while (y/n): ").lower()
-    if response in ['y', 'yes']:
-        generate_fullsize_cursors(theme_dir)
+    generate = response in ['y', 'yes']
+    build_dir = create_build_dir() if generate else None
+    
+    theme_name = "fullsize_pro_cursors"
+    on_config, pending = start_fullsize_generation(theme_name, build_dir) if generate else (None, None)
+    
+    try:
+        # Create full-size theme, cursor generation runs alongside image scaling
+        theme_dir = create_fullsize_cursor_theme(
+            image_folder=".",
+            theme_name=theme_name,
+            build_dir=build_dir,
+            on_config=on_config
+        )
+        
+        # Generate cursor files
+        if generate:
+            generate_fullsize_cursors(theme_dir, build_dir, pending)
+    finally:
+        # Don't leave xcursorgen runs or a staging directory behind in /dev/shm
+        if pending:
+            pending[0].shutdown(cancel_futures=True)
+        if build_dir:
+            shutil.rmtree(build_dir, ignore_errors=True)
     
     # Create high-DPI configuration script
     create_high_dpi_script(theme_dir)